@@ -1,6 +1,8 @@
 import os
+import re
 import json
 from datetime import datetime
+from functools import lru_cache
 
 from mcp.server.fastmcp import FastMCP
 from mcp.server.auth.settings import AuthSettings
@@ -8,6 +10,7 @@ from pydantic import AnyHttpUrl
 from dotenv import load_dotenv
 
 from utils.auth import create_auth0_verifier
+from models import data_version
 from service import DependencyService
 from stats import get_dependency_health_overview, get_stale_dependencies
 
@@ -26,15 +29,51 @@ if not auth0_domain:
 if not resource_server_url:
     raise ValueError("RESOURCE_SERVER_URL environment variable is required")
 
+# Prompt files live next to this script; names are restricted so they
+# cannot escape the prompts/ directory
+script_dir = os.path.dirname(os.path.abspath(__file__))
+_PROMPT_NAME_RE = re.compile(r"^[a-zA-Z0-9_\-]+$")
+
+
+@lru_cache(maxsize=32)
+def _load_prompt(name: str) -> str:
+    """Read prompts/<name>.md once; prompt files do not change at runtime."""
+    if not _PROMPT_NAME_RE.fullmatch(name):
+        raise ValueError(f"Invalid prompt name '{name}'")
+    with open(os.path.join(script_dir, "prompts", f"{name}.md"), "r") as file:
+        return file.read()
+
+
 # Load server instructions
-with open("prompts/server_instructions.md", "r") as file:
-    server_instructions = file.read()
+server_instructions = _load_prompt("server_instructions")
 
 # Initialize Auth0 token verifier
 token_verifier = create_auth0_verifier()
 
 port = int(os.getenv("PORT", 8000))
 
+# Shared encoder for tool responses; json.dumps() would build a new
+# JSONEncoder on every call
+_json_encoder = json.JSONEncoder(indent=2)
+
+
+def _dumps(obj) -> str:
+    """Serialize a tool response as indented JSON."""
+    return _json_encoder.encode(obj)
+
+
+@lru_cache(maxsize=256)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO date string, caching results for repeated date windows."""
+    return datetime.fromisoformat(value)
+
+
+@lru_cache(maxsize=1)
+def _all_dependencies_json(version: int) -> str:
+    """Serialize the full dependency list once per data version."""
+    return _dumps(dependency_service.get_all_dependencies())
+
+
 # Create an MCP server with OAuth authentication
 mcp = FastMCP(
     "yt-mcp",
@@ -59,10 +98,9 @@ def get_all_dependencies() -> str:
         str: JSON string containing list of all dependencies
     """
     try:
-        dependencies = dependency_service.get_all_dependencies()
-        return json.dumps(dependencies, indent=2)
+        return _all_dependencies_json(data_version())
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _dumps({"error": str(e)})
 
 
 @mcp.tool()
@@ -79,11 +117,11 @@ def get_dependency_by_id(dependency_id: str) -> str:
     try:
         dependency = dependency_service.get_dependency_by_id(dependency_id)
         if dependency:
-            return json.dumps(dependency, indent=2)
+            return _dumps(dependency)
         else:
-            return json.dumps({"error": f"Dependency with id '{dependency_id}' not found"}, indent=2)
+            return _dumps({"error": f"Dependency with id '{dependency_id}' not found"})
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _dumps({"error": str(e)})
 
 
 @mcp.tool()
@@ -100,11 +138,11 @@ def get_dependency_by_name(name: str) -> str:
     try:
         dependency = dependency_service.get_dependency_by_name(name)
         if dependency:
-            return json.dumps(dependency, indent=2)
+            return _dumps(dependency)
         else:
-            return json.dumps({"error": f"Dependency with name '{name}' not found"}, indent=2)
+            return _dumps({"error": f"Dependency with name '{name}' not found"})
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _dumps({"error": str(e)})
 
 
 @mcp.tool()
@@ -120,9 +158,9 @@ def search_dependencies(query: str) -> str:
     """
     try:
         dependencies = dependency_service.search_dependencies(query)
-        return json.dumps(dependencies, indent=2)
+        return _dumps(dependencies)
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _dumps({"error": str(e)})
 
 
 @mcp.tool()
@@ -138,9 +176,9 @@ def check_dependency_existence(name: str) -> str:
     """
     try:
         exists = dependency_service.dependency_exists(name)
-        return json.dumps({"name": name, "exists": exists}, indent=2)
+        return _dumps({"name": name, "exists": exists})
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _dumps({"error": str(e)})
 
 
 @mcp.tool()
@@ -156,14 +194,14 @@ def find_updated_dependencies(start_date: str, end_date: str) -> str:
         str: JSON string containing list of dependencies updated in the date range
     """
     try:
-        start = datetime.fromisoformat(start_date)
-        end = datetime.fromisoformat(end_date)
+        start = _parse_iso(start_date)
+        end = _parse_iso(end_date)
         dependencies = dependency_service.find_updated_between(start, end)
-        return json.dumps(dependencies, indent=2)
+        return _dumps(dependencies)
     except ValueError as e:
-        return json.dumps({"error": f"Invalid date format: {str(e)}"}, indent=2)
+        return _dumps({"error": f"Invalid date format: {str(e)}"})
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _dumps({"error": str(e)})
 
 
 @mcp.tool()
@@ -179,14 +217,14 @@ def find_dependencies_with_planned_updates(start_date: str, end_date: str) -> st
         str: JSON string containing list of dependencies with planned updates in the date range
     """
     try:
-        start = datetime.fromisoformat(start_date)
-        end = datetime.fromisoformat(end_date)
+        start = _parse_iso(start_date)
+        end = _parse_iso(end_date)
         dependencies = dependency_service.find_next_update_between(start, end)
-        return json.dumps(dependencies, indent=2)
+        return _dumps(dependencies)
     except ValueError as e:
-        return json.dumps({"error": f"Invalid date format: {str(e)}"}, indent=2)
+        return _dumps({"error": f"Invalid date format: {str(e)}"})
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _dumps({"error": str(e)})
 
 
 @mcp.tool()
@@ -206,9 +244,9 @@ def get_health_overview() -> str:
     """
     try:
         overview = get_dependency_health_overview()
-        return json.dumps(overview, indent=2)
+        return _dumps(overview)
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _dumps({"error": str(e)})
 
 
 @mcp.tool()
@@ -224,9 +262,9 @@ def get_stale_dependencies_tool(days_threshold: int = 180) -> str:
     """
     try:
         stale_info = get_stale_dependencies(days_threshold)
-        return json.dumps(stale_info, indent=2)
+        return _dumps(stale_info)
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _dumps({"error": str(e)})
 
 
 @mcp.tool()
@@ -243,19 +281,38 @@ def create_sample_dependency(name: str, test_version: str, prod_version: str = N
         str: JSON string containing the created dependency data
     """
     try:
-        # check if dependency already exists
-        if dependency_service.dependency_exists(name):
-            return json.dumps({"error": f"Dependency with name '{name}' already exists"}, indent=2)
-        
-        # create the dependency
+        # create the dependency (raises if the name is already taken)
         dependency = dependency_service.create_dependency(
             name=name,
             test_version=test_version,
             prod_version=prod_version
         )
-        return json.dumps(dependency, indent=2)
+        return _dumps(dependency)
+    except Exception as e:
+        return _dumps({"error": str(e)})
+
+
+@mcp.tool()
+def fetch_instructions(prompt_name: str) -> str:
+    """
+    Fetch writing instructions for a given prompt name from the prompts/ directory.
+    
+    Args:
+        prompt_name: Name of the prompt to fetch instructions for
+            Available prompts:
+            - write_blog_post
+            - write_social_post
+            - write_video_chapters
+    
+    Returns:
+        str: Instructions for the given prompt or JSON error message
+    """
+    try:
+        return _load_prompt(prompt_name)
+    except FileNotFoundError:
+        return _dumps({"error": f"Prompt '{prompt_name}' not found"})
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _dumps({"error": str(e)})
 
 
 if __name__ == "__main__":
@@ -2,16 +2,37 @@
 In-memory data structure for dependency management system.
 Simple hardcoded data - no database needed.
 """
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Optional
-import uuid
+import os
+
+
+def utcnow() -> datetime:
+    """
+    Return the current UTC time as a naive datetime.
+    Replaces the deprecated datetime.utcnow(); stored timestamps and
+    client-supplied date bounds are naive UTC, so the result stays naive.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def generate_id() -> str:
+    """
+    Generate a random version 4 UUID string.
+    Formats os.urandom() bytes directly instead of building a uuid.UUID.
+    """
+    b = bytearray(os.urandom(16))
+    b[6] = b[6] & 0x0F | 0x40  # version 4
+    b[8] = b[8] & 0x3F | 0x80  # RFC 4122 variant
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
 
 # hardcoded sample dependencies
-now = datetime.utcnow()
+now = utcnow()
 
 DEPENDENCIES: List[Dict] = [
     {
-        "id": str(uuid.uuid4()),
+        "id": generate_id(),
         "name": "spring-boot-starter-web",
         "testVersion": "3.2.1",
         "prodVersion": "3.1.5",
@@ -26,7 +47,7 @@ DEPENDENCIES: List[Dict] = [
         "updatedAt": (now - timedelta(days=15)).isoformat(),
     },
     {
-        "id": str(uuid.uuid4()),
+        "id": generate_id(),
         "name": "spring-data-jpa",
         "testVersion": "3.2.0",
         "prodVersion": "3.2.0",
@@ -41,7 +62,7 @@ DEPENDENCIES: List[Dict] = [
         "updatedAt": (now - timedelta(days=20)).isoformat(),
     },
     {
-        "id": str(uuid.uuid4()),
+        "id": generate_id(),
         "name": "postgresql-driver",
         "testVersion": "42.7.1",
         "prodVersion": "42.6.0",
@@ -56,7 +77,7 @@ DEPENDENCIES: List[Dict] = [
         "updatedAt": (now - timedelta(days=10)).isoformat(),
     },
     {
-        "id": str(uuid.uuid4()),
+        "id": generate_id(),
         "name": "lombok",
         "testVersion": "1.18.30",
         "prodVersion": None,  # test-only dependency
@@ -71,7 +92,7 @@ DEPENDENCIES: List[Dict] = [
         "updatedAt": (now - timedelta(days=5)).isoformat(),
     },
     {
-        "id": str(uuid.uuid4()),
+        "id": generate_id(),
         "name": "jackson-databind",
         "testVersion": "2.16.0",
         "prodVersion": "2.15.3",
@@ -86,7 +107,7 @@ DEPENDENCIES: List[Dict] = [
         "updatedAt": (now - timedelta(days=7)).isoformat(),
     },
     {
-        "id": str(uuid.uuid4()),
+        "id": generate_id(),
         "name": "hibernate-core",
         "testVersion": "6.4.1",
         "prodVersion": "6.3.1",
@@ -101,7 +122,7 @@ DEPENDENCIES: List[Dict] = [
         "updatedAt": (now - timedelta(days=200)).isoformat(),
     },
     {
-        "id": str(uuid.uuid4()),
+        "id": generate_id(),
         "name": "junit-jupiter",
         "testVersion": "5.10.1",
         "prodVersion": None,  # test-only
@@ -116,7 +137,7 @@ DEPENDENCIES: List[Dict] = [
         "updatedAt": (now - timedelta(days=3)).isoformat(),
     },
     {
-        "id": str(uuid.uuid4()),
+        "id": generate_id(),
         "name": "slf4j-api",
         "testVersion": "2.0.10",
         "prodVersion": "2.0.10",
@@ -132,4 +153,78 @@ DEPENDENCIES: List[Dict] = [
     },
 ]
 
+# lookup indexes over DEPENDENCIES, kept in sync by add_dependency()
+DEPENDENCIES_BY_ID: Dict[str, Dict] = {}
+DEPENDENCIES_BY_NAME: Dict[str, Dict] = {}
+
+# column views of DEPENDENCIES, aligned by position and kept in sync by
+# add_dependency(), so scans read flat lists instead of chasing row dicts
+NAMES: List[str] = []
+NAMES_LOWER: List[str] = []
+TEST_VERSIONS: List[Optional[str]] = []
+PROD_VERSIONS: List[Optional[str]] = []
+
+# timestamp columns, parsed once at insert time so date scans don't re-run
+# fromisoformat() on every call
+TEST_LAST_UPDATED: List[Optional[datetime]] = []
+PRODUCTION_LAST_UPDATED: List[Optional[datetime]] = []
+TEST_NEXT_UPDATE: List[Optional[datetime]] = []
+PRODUCTION_NEXT_UPDATE: List[Optional[datetime]] = []
+CREATED_AT: List[Optional[datetime]] = []
+# soonest planned update and latest actual update across test and prod
+EARLIEST_NEXT_UPDATE: List[Optional[datetime]] = []
+LATEST_LAST_UPDATED: List[Optional[datetime]] = []
+
+# bumped on every write so derived caches can tell when they are stale
+_version = 0
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse an optional ISO timestamp string.
+    """
+    return datetime.fromisoformat(value) if value else None
+
+
+def _index_dependency(dependency: Dict) -> None:
+    """
+    Register a dependency in the lookup indexes and derived columns.
+    """
+    DEPENDENCIES_BY_ID[dependency["id"]] = dependency
+    DEPENDENCIES_BY_NAME[dependency["name"]] = dependency
+    NAMES.append(dependency["name"])
+    NAMES_LOWER.append(dependency["name"].lower())
+    TEST_VERSIONS.append(dependency.get("testVersion"))
+    PROD_VERSIONS.append(dependency.get("prodVersion"))
+    test_last = _parse_datetime(dependency.get("testLastUpdated"))
+    prod_last = _parse_datetime(dependency.get("productionLastUpdated"))
+    test_next = _parse_datetime(dependency.get("testNextUpdate"))
+    prod_next = _parse_datetime(dependency.get("productionNextUpdate"))
+    TEST_LAST_UPDATED.append(test_last)
+    PRODUCTION_LAST_UPDATED.append(prod_last)
+    TEST_NEXT_UPDATE.append(test_next)
+    PRODUCTION_NEXT_UPDATE.append(prod_next)
+    CREATED_AT.append(_parse_datetime(dependency.get("createdAt")))
+    EARLIEST_NEXT_UPDATE.append(min((d for d in (test_next, prod_next) if d), default=None))
+    LATEST_LAST_UPDATED.append(max((d for d in (test_last, prod_last) if d), default=None))
+
+
+def data_version() -> int:
+    """
+    Return a counter that changes whenever DEPENDENCIES is modified.
+    """
+    return _version
+
+
+def add_dependency(dependency: Dict) -> None:
+    """
+    Append a dependency to the in-memory store and its lookup indexes.
+    """
+    global _version
+    DEPENDENCIES.append(dependency)
+    _index_dependency(dependency)
+    _version += 1
+
 
+for _dependency in DEPENDENCIES:
+    _index_dependency(_dependency)
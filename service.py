@@ -4,8 +4,45 @@ Simple in-memory implementation.
 """
 from typing import List, Dict, Optional
 from datetime import datetime
-from models import DEPENDENCIES
-import uuid
+from functools import lru_cache
+from models import (
+    DEPENDENCIES,
+    DEPENDENCIES_BY_ID,
+    DEPENDENCIES_BY_NAME,
+    NAMES_LOWER,
+    PRODUCTION_LAST_UPDATED,
+    PRODUCTION_NEXT_UPDATE,
+    TEST_LAST_UPDATED,
+    TEST_NEXT_UPDATE,
+    add_dependency,
+    data_version,
+    generate_id,
+    utcnow,
+)
+
+
+def _filter_between(
+    test_dates: List[Optional[datetime]],
+    prod_dates: List[Optional[datetime]],
+    start: datetime,
+    end: datetime,
+) -> List[Dict]:
+    """
+    Return dependencies whose test or prod date falls within [start, end].
+    """
+    return [
+        dep
+        for dep, test_date, prod_date in zip(DEPENDENCIES, test_dates, prod_dates)
+        if (test_date and start <= test_date <= end) or (prod_date and start <= prod_date <= end)
+    ]
+
+
+@lru_cache(maxsize=1024)
+def _search_by_name(query_lower: str, version: int) -> List[Dict]:
+    """
+    Case-insensitive partial name match, cached per data version.
+    """
+    return [dep for dep, name_lower in zip(DEPENDENCIES, NAMES_LOWER) if query_lower in name_lower]
 
 
 class DependencyService:
@@ -23,78 +60,39 @@ class DependencyService:
         """
         Retrieve a dependency by its UUID.
         """
-        for dep in DEPENDENCIES:
-            if dep["id"] == id:
-                return dep
-        return None
+        return DEPENDENCIES_BY_ID.get(id)
 
     def get_dependency_by_name(self, name: str) -> Optional[Dict]:
         """
         Retrieve a dependency by its name (exact match).
         """
-        for dep in DEPENDENCIES:
-            if dep["name"] == name:
-                return dep
-        return None
+        return DEPENDENCIES_BY_NAME.get(name)
 
     def search_dependencies(self, query: str) -> List[Dict]:
         """
         Search dependencies by name (case-insensitive partial match).
         """
-        query_lower = query.lower()
-        return [dep for dep in DEPENDENCIES if query_lower in dep["name"].lower()]
+        return list(_search_by_name(query.lower(), data_version()))
 
     def dependency_exists(self, name: str) -> bool:
         """
         Check if a dependency with the given name exists.
         """
-        return any(dep["name"] == name for dep in DEPENDENCIES)
+        return name in DEPENDENCIES_BY_NAME
 
     def find_updated_between(self, start: datetime, end: datetime) -> List[Dict]:
         """
         Find dependencies that were updated between the given date range.
         Checks both testLastUpdated and productionLastUpdated fields.
         """
-        results = []
-        for dep in DEPENDENCIES:
-            test_updated = dep.get("testLastUpdated")
-            prod_updated = dep.get("productionLastUpdated")
-            
-            if test_updated:
-                test_date = datetime.fromisoformat(test_updated)
-                if start <= test_date <= end:
-                    results.append(dep)
-                    continue
-            
-            if prod_updated:
-                prod_date = datetime.fromisoformat(prod_updated)
-                if start <= prod_date <= end:
-                    results.append(dep)
-        
-        return results
+        return _filter_between(TEST_LAST_UPDATED, PRODUCTION_LAST_UPDATED, start, end)
 
     def find_next_update_between(self, start: datetime, end: datetime) -> List[Dict]:
         """
         Find dependencies with planned updates in the given date range.
         Checks both testNextUpdate and productionNextUpdate fields.
         """
-        results = []
-        for dep in DEPENDENCIES:
-            test_next = dep.get("testNextUpdate")
-            prod_next = dep.get("productionNextUpdate")
-            
-            if test_next:
-                test_date = datetime.fromisoformat(test_next)
-                if start <= test_date <= end:
-                    results.append(dep)
-                    continue
-            
-            if prod_next:
-                prod_date = datetime.fromisoformat(prod_next)
-                if start <= prod_date <= end:
-                    results.append(dep)
-        
-        return results
+        return _filter_between(TEST_NEXT_UPDATE, PRODUCTION_NEXT_UPDATE, start, end)
 
     def create_dependency(self, name: str, test_version: str, **kwargs) -> Dict:
         """
@@ -107,25 +105,31 @@ class DependencyService:
         
         Returns:
             Dictionary representation of the created dependency
+        
+        Raises:
+            ValueError: If a dependency with the same name already exists
         """
-        now = datetime.utcnow()
+        if self.dependency_exists(name):
+            raise ValueError(f"Dependency with name '{name}' already exists")
+        
+        timestamp = utcnow().isoformat()
         
         dependency = {
-            "id": str(uuid.uuid4()),
+            "id": generate_id(),
             "name": name,
             "testVersion": test_version,
             "prodVersion": kwargs.get('prod_version'),
-            "testLastUpdated": now.isoformat(),
+            "testLastUpdated": timestamp,
             "productionLastUpdated": None,
             "testNextUpdate": None,
             "productionNextUpdate": None,
             "sourceUrl": kwargs.get('source_url'),
             "changelogUrl": kwargs.get('changelog_url'),
             "homepageUrl": kwargs.get('homepage_url'),
-            "createdAt": now.isoformat(),
-            "updatedAt": now.isoformat(),
+            "createdAt": timestamp,
+            "updatedAt": timestamp,
         }
         
-        DEPENDENCIES.append(dependency)
+        add_dependency(dependency)
         return dependency
 
@@ -4,7 +4,34 @@ Simple in-memory implementation.
 """
 from typing import Dict
 from datetime import datetime, timedelta
-from models import DEPENDENCIES
+from functools import lru_cache
+from operator import itemgetter
+from models import (
+    CREATED_AT,
+    EARLIEST_NEXT_UPDATE,
+    LATEST_LAST_UPDATED,
+    NAMES,
+    PROD_VERSIONS,
+    TEST_VERSIONS,
+    data_version,
+    utcnow,
+)
+
+
+def _current_minute() -> datetime:
+    """
+    Return the current UTC time truncated to the minute.
+    The cached stats helpers take this and data_version() purely as cache
+    keys, so writes and the passage of time invalidate their results.
+    """
+    return utcnow().replace(second=0, microsecond=0)
+
+
+def _copy_result(result: Dict) -> Dict:
+    """
+    Copy a cached result so callers can't modify the cached dict or its lists.
+    """
+    return {key: list(value) if isinstance(value, list) else value for key, value in result.items()}
 
 
 def get_dependency_health_overview() -> Dict:
@@ -22,64 +49,39 @@ def get_dependency_health_overview() -> Dict:
     - recentlyUpdatedCount: count of dependencies updated in last 30 days
     - recentlyUpdatedDependencies: list of recently updated dependency names
     """
-    total_count = len(DEPENDENCIES)
+    return _copy_result(_health_overview(data_version(), _current_minute()))
+
+
+@lru_cache(maxsize=1)
+def _health_overview(version: int, minute: datetime) -> Dict:
+    """
+    Compute the health overview (cached).
+    """
+    total_count = len(NAMES)
+    now = utcnow()
+    thirty_days_ago = now - timedelta(days=30)
     
-    # calculate version drift (test version != prod version)
     version_drift_deps = []
-    for dep in DEPENDENCIES:
-        prod_version = dep.get("prodVersion")
-        test_version = dep.get("testVersion")
-        if prod_version and test_version != prod_version:
-            version_drift_deps.append(dep["name"])
-    
-    # calculate overdue updates (next update dates in the past)
-    now = datetime.utcnow()
     overdue_deps = []
-    for dep in DEPENDENCIES:
-        is_overdue = False
-        
-        test_next = dep.get("testNextUpdate")
-        if test_next:
-            test_next_date = datetime.fromisoformat(test_next)
-            if test_next_date < now:
-                is_overdue = True
-        
-        prod_next = dep.get("productionNextUpdate")
-        if prod_next:
-            prod_next_date = datetime.fromisoformat(prod_next)
-            if prod_next_date < now:
-                is_overdue = True
-        
-        if is_overdue:
-            overdue_deps.append(dep["name"])
-    
-    # calculate test-only dependencies (no prod version)
     test_only_deps = []
-    for dep in DEPENDENCIES:
-        prod_version = dep.get("prodVersion")
-        if not prod_version:
-            test_only_deps.append(dep["name"])
-    
-    # calculate recently updated (last 30 days)
-    thirty_days_ago = now - timedelta(days=30)
     recently_updated_deps = []
-    for dep in DEPENDENCIES:
-        is_recent = False
-        
-        test_updated = dep.get("testLastUpdated")
-        if test_updated:
-            test_date = datetime.fromisoformat(test_updated)
-            if test_date >= thirty_days_ago:
-                is_recent = True
+    
+    # evaluate every bucket in a single pass over the rows
+    rows = zip(NAMES, TEST_VERSIONS, PROD_VERSIONS, EARLIEST_NEXT_UPDATE, LATEST_LAST_UPDATED)
+    for name, test_version, prod_version, next_update, last_updated in rows:
+        # version drift (test version != prod version) / test-only (no prod version)
+        if not prod_version:
+            test_only_deps.append(name)
+        elif test_version != prod_version:
+            version_drift_deps.append(name)
         
-        prod_updated = dep.get("productionLastUpdated")
-        if prod_updated:
-            prod_date = datetime.fromisoformat(prod_updated)
-            if prod_date >= thirty_days_ago:
-                is_recent = True
+        # overdue updates (next update dates in the past)
+        if next_update and next_update < now:
+            overdue_deps.append(name)
         
-        if is_recent:
-            recently_updated_deps.append(dep["name"])
+        # recently updated (last 30 days)
+        if last_updated and last_updated >= thirty_days_ago:
+            recently_updated_deps.append(name)
     
     return {
         "totalCount": total_count,
@@ -109,42 +111,33 @@ def get_stale_dependencies(days_threshold: int = 180) -> Dict:
         - oldestDependency: name of the oldest dependency
         - oldestDependencyDays: how many days since oldest was updated
     """
-    now = datetime.utcnow()
+    return _copy_result(_stale_dependencies(days_threshold, data_version(), _current_minute()))
+
+
+@lru_cache(maxsize=64)
+def _stale_dependencies(days_threshold: int, version: int, minute: datetime) -> Dict:
+    """
+    Compute stale dependencies for the given threshold (cached).
+    """
+    now = utcnow()
     threshold_date = now - timedelta(days=days_threshold)
     
-    stale_deps = []
-    oldest_dep = None
-    oldest_days = 0
-    
-    for dep in DEPENDENCIES:
-        # get the most recent update date (either test or prod)
-        last_updated = None
-        
-        test_updated = dep.get("testLastUpdated")
-        prod_updated = dep.get("productionLastUpdated")
-        
-        if test_updated and prod_updated:
-            test_date = datetime.fromisoformat(test_updated)
-            prod_date = datetime.fromisoformat(prod_updated)
-            last_updated = max(test_date, prod_date)
-        elif test_updated:
-            last_updated = datetime.fromisoformat(test_updated)
-        elif prod_updated:
-            last_updated = datetime.fromisoformat(prod_updated)
-        
+    # (name, days since last update) for each stale dependency
+    stale = []
+    for name, last_updated, created in zip(NAMES, LATEST_LAST_UPDATED, CREATED_AT):
         # if no update dates, use created date
         if not last_updated:
-            created = dep.get("createdAt")
-            if created:
-                last_updated = datetime.fromisoformat(created)
+            last_updated = created
         
         # check if stale
         if last_updated and last_updated < threshold_date:
-            stale_deps.append(dep["name"])
-            days_old = (now - last_updated).days
-            if days_old > oldest_days:
-                oldest_days = days_old
-                oldest_dep = dep["name"]
+            stale.append((name, (now - last_updated).days))
+    
+    # oldest is the first entry with the most whole days (same-day updates don't count)
+    oldest_dep, oldest_days = max(
+        (entry for entry in stale if entry[1] > 0), key=itemgetter(1), default=(None, 0)
+    )
+    stale_deps = [name for name, _ in stale]
     
     return {
         "staleDependencies": stale_deps,
@@ -4,10 +4,13 @@ Auth0 OAuth token verification for YouTube MCP Server.
 
 import os
 import asyncio
+import logging
 from typing import Optional
 from jwt import PyJWKClient, decode, InvalidTokenError
 from mcp.server.auth.provider import AccessToken, TokenVerifier
 
+logger = logging.getLogger(__name__)
+
 
 class Auth0TokenVerifier(TokenVerifier):
     """Verifies OAuth tokens issued by Auth0."""
@@ -63,10 +66,10 @@ class Auth0TokenVerifier(TokenVerifier):
             )
 
         except InvalidTokenError as e:
-            print(f"JWT verification failed: {e}")
+            logger.warning("JWT verification failed: %s", e)
             return None
         except Exception as e:
-            print(f"Token verification error: {e}")
+            logger.error("Token verification error: %s", e)
             return None
 
 